@@ -3,10 +3,27 @@ from __future__ import annotations
 
 import argparse
 import re
-import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None  # type: ignore[assignment]
+
+
+_SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+# Body of the top-level `[project]` table, up to the next table header.
+_PROJECT_TABLE_RE = re.compile(
+    r"^\[project\][ \t]*\n(?P<body>.*?)(?=^\[|\Z)", re.MULTILINE | re.DOTALL
+)
+_PROJECT_VERSION_LINE_RE = re.compile(
+    r"^[ \t]*version[ \t]*=[ \t]*\"([^\"]+)\"[ \t]*$", re.MULTILINE
+)
+# Docs pins: git tag references (`@vX.Y.Z`) or `version: X.Y.Z` metadata lines
+# (group 1 holds the metadata version).
+_DOC_PINS_RE = re.compile(r"@v\d+\.\d+\.\d+\b|version: (\d+\.\d+\.\d+)\b")
+
 
 @dataclass(frozen=True)
 class Version:
@@ -16,7 +33,7 @@ class Version:
 
     @classmethod
     def parse(cls, s: str) -> "Version":
-        m = re.fullmatch(r"(\d+)\.(\d+)\.(\d+)", s)
+        m = _SEMVER_RE.fullmatch(s)
         if not m:
             raise ValueError(f"expected X.Y.Z, got {s!r}")
         return cls(int(m.group(1)), int(m.group(2)), int(m.group(3)))
@@ -47,70 +64,76 @@ def _write_text(path: Path, text: str) -> None:
 
 
 def _get_project_version_from_pyproject(pyproject: Path) -> str:
-    lines = _read_text(pyproject).splitlines(True)
-    in_project = False
-    for line in lines:
-        if line.strip() == "[project]":
-            in_project = True
-            continue
-        if in_project and line.startswith("["):
-            break
-        if in_project:
-            m = re.match(r"^version\s*=\s*\"([^\"]+)\"\s*$", line.strip())
-            if m:
-                return m.group(1)
-    raise RuntimeError("could not find [project].version in pyproject.toml")
+    if tomllib is not None:
+        with pyproject.open("rb") as f:
+            data = tomllib.load(f)
+        try:
+            return str(data["project"]["version"])
+        except (KeyError, TypeError) as e:
+            raise RuntimeError(
+                "could not find [project].version in pyproject.toml"
+            ) from e
+
+    table = _PROJECT_TABLE_RE.search(_read_text(pyproject))
+    m = _PROJECT_VERSION_LINE_RE.search(table.group("body")) if table else None
+    if not m:
+        raise RuntimeError("could not find [project].version in pyproject.toml")
+    return m.group(1)
 
 
 def _set_project_version_in_pyproject(pyproject: Path, new_version: str) -> None:
-    lines = _read_text(pyproject).splitlines(True)
-    out: list[str] = []
-    in_project = False
-    changed = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped == "[project]":
-            in_project = True
-            out.append(line)
-            continue
-        if in_project and stripped.startswith("["):
-            in_project = False
-
-        if in_project and re.match(r"^version\s*=\s*\"[^\"]+\"\s*$", stripped):
-            out.append(f'version = "{new_version}"\n')
-            changed = True
-        else:
-            out.append(line)
-
-    if not changed:
+    # Text-based on purpose: preserves formatting and comments in pyproject.toml.
+    text = _read_text(pyproject)
+    table = _PROJECT_TABLE_RE.search(text)
+    if table is None:
         raise RuntimeError("could not update [project].version in pyproject.toml")
-    _write_text(pyproject, "".join(out))
 
+    body, count = _PROJECT_VERSION_LINE_RE.subn(
+        lambda _m: f'version = "{new_version}"', table.group("body"), count=1
+    )
+    if not count:
+        raise RuntimeError("could not update [project].version in pyproject.toml")
+    start, end = table.span("body")
+    _write_text(pyproject, text[:start] + body + text[end:])
 
-def _replace_all(path: Path, old: str, new: str) -> bool:
-    text = _read_text(path)
-    if old not in text:
-        return False
-    _write_text(path, text.replace(old, new))
-    return True
 
+def _update_doc_pins(path: Path, *, old_version: str, new_version: str) -> bool:
+    """Update version pins in a docs file with a single read and substitution pass.
 
-def _replace_pinned_git_tag(path: Path, new_version: str) -> bool:
-    """Replace pinned git tag references like `@v1.2.3` with `@v<new_version>`.
+    Rewrites:
+    - pinned git tag references like `@v1.2.3` (any version, including stale
+      ones) to `@v<new_version>`; we keep the Python package version as X.Y.Z,
+      but git tags commonly use vX.Y.Z.
+    - metadata lines `version: <old_version>` to `version: <new_version>`.
 
-    We keep the Python package version as X.Y.Z, but git tags commonly use vX.Y.Z.
+    Returns False (without writing) when the file is missing or unchanged.
     """
 
-    text = _read_text(path)
+    try:
+        text = _read_text(path)
+    except FileNotFoundError:
+        return False
+    # Cheap substring pretest before any regex work.
+    if "@v" not in text and "version:" not in text:
+        return False
+
     new_tag = f"@v{new_version}"
-    out = re.sub(r"@v\d+\.\d+\.\d+\b", new_tag, text)
+    new_meta = f"version: {new_version}"
+
+    def _replace(m: re.Match[str]) -> str:
+        meta = m.group(1)
+        if meta is None:
+            return new_tag
+        return new_meta if meta == old_version else m.group(0)
+
+    out = _DOC_PINS_RE.sub(_replace, text)
     if out == text:
         return False
     _write_text(path, out)
     return True
 
 
-def main(argv: list[str] | None = None) -> int:
+def _make_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         description="Bump matplotlib-window-tracker project version"
     )
@@ -119,7 +142,11 @@ def main(argv: list[str] | None = None) -> int:
     g.add_argument("--major", action="store_true", help="Bump major")
     g.add_argument("--minor", action="store_true", help="Bump minor")
     g.add_argument("--patch", action="store_true", help="Bump patch")
-    args = p.parse_args(argv)
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _make_parser().parse_args(argv)
 
     root = _repo_root()
     pyproject = root / "pyproject.toml"
@@ -144,26 +171,13 @@ def main(argv: list[str] | None = None) -> int:
     _set_project_version_in_pyproject(pyproject, new)
 
     # Keep docs and skill pins aligned with tag format vX.Y.Z.
-    tag_old = f"v{old}"
-    tag_new = f"v{new}"
     updated: list[str] = []
     for rel in (
         Path("README.md"),
         Path("skills/matplotlib-window-tracker/SKILL.md"),
     ):
         path = root / rel
-        if not path.exists():
-            continue
-        changed = False
-        if _replace_all(path, f"@{tag_old}", f"@{tag_new}"):
-            changed = True
-        # Also fix any stale pinned tag that doesn't match the immediate old version.
-        if _replace_pinned_git_tag(path, new):
-            changed = True
-        if _replace_all(path, f"version: {old}", f"version: {new}"):
-            changed = True
-
-        if changed:
+        if _update_doc_pins(path, old_version=old, new_version=new):
             updated.append(str(rel))
 
     print(f"pyproject.toml: {old} -> {new}")
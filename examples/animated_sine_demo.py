@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import json
 import math
 import time
 
+import numpy as np
+
 
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(
         description=(
-            "Matplotlib-native animated sine demo (two windows; line.set_ydata + plt.pause)."
+            "Matplotlib-native animated sine demo "
+            "(two windows; line.set_ydata + draw_idle/flush_events)."
         )
     )
     p.add_argument("--frames", type=int, default=200, help="Number of frames")
@@ -16,8 +20,11 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument(
         "--pause",
         type=float,
-        default=0.001,
-        help="plt.pause() dt (GUI event pumping)",
+        default=0.0,
+        help=(
+            "If > 0, pump GUI events with plt.pause(PAUSE) instead of "
+            "draw_idle() + flush_events()"
+        ),
     )
     p.add_argument(
         "--fps",
@@ -46,11 +53,18 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     n = max(args.n, 10)
-    xdata = [i / (n - 1) for i in range(n)]
-    omega_x = [2.0 * math.pi * xi for xi in xdata]
+    # One read-only x grid shared by both lines (never rewritten while animating).
+    xdata = np.linspace(0.0, 1.0, n, dtype=np.float64)
+    xdata.flags.writeable = False
+    omega_x = (2.0 * np.pi) * xdata
+    sin_omega_x = np.sin(omega_x)
+    # Per-frame scratch/output buffers (reused; Line2D accepts ndarrays directly).
+    phi = np.empty(n)
+    y_phase = np.empty(n)
+    y_amp = np.empty(n)
 
     fig1, ax1 = plt.subplots(num="animated_sine: phase", clear=True, figsize=(8, 4))
-    (line1,) = ax1.plot(xdata, [0.0] * n)
+    (line1,) = ax1.plot(xdata, np.zeros(n))
     ax1.set_ylim(-1.2, 1.2)
     ax1.grid(True, alpha=0.3)
     ax1.set_title("moving sine (phase)")
@@ -71,7 +85,7 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     fig2, ax2 = plt.subplots(num="animated_sine: amplitude", clear=True, figsize=(8, 4))
-    (line2,) = ax2.plot(xdata, [0.0] * n, color="tab:orange")
+    (line2,) = ax2.plot(xdata, np.zeros(n), color="tab:orange")
     ax2.set_ylim(-1.2, 1.2)
     ax2.grid(True, alpha=0.3)
     ax2.set_title("amplitude-modulated sine")
@@ -103,28 +117,35 @@ def main(argv: list[str] | None = None) -> int:
     tracker1 = track_position_size(fig1, tag="animated_sine_phase")
     tracker2 = track_position_size(fig2, tag="animated_sine_amplitude")
 
-    def _has_cached_entry(cache_path, *, tag: str, machine_id: str) -> bool:
+    def _load_cache_entries(cache_path) -> dict:
         try:
-            import json
-
-            if not cache_path.exists():
-                return False
             cache = json.loads(cache_path.read_text(encoding="utf-8"))
-            per_tag = cache.get("entries", {}).get(tag, {})
-            return machine_id in per_tag
+            entries = cache.get("entries", {})
+            return entries if isinstance(entries, dict) else {}
         except Exception:
-            return False
+            return {}
+
+    def _has_cached_entry(entries: dict, *, tag: str, machine_id: str) -> bool:
+        per_tag = entries.get(tag, {})
+        return isinstance(per_tag, dict) and machine_id in per_tag
 
     if tracker1 is not None and tracker2 is not None:
         # If there is no cached geometry yet, place the windows with a small
         # offset so it's obvious there are two figures.
+        # Both trackers normally share one cache file; read it only once.
+        entries1 = _load_cache_entries(tracker1.cache_path)
+        entries2 = (
+            entries1
+            if tracker2.cache_path == tracker1.cache_path
+            else _load_cache_entries(tracker2.cache_path)
+        )
         cached1 = _has_cached_entry(
-            tracker1.cache_path,
+            entries1,
             tag=tracker1.tag,
             machine_id=tracker1.machine_id,
         )
         cached2 = _has_cached_entry(
-            tracker2.cache_path,
+            entries2,
             tag=tracker2.tag,
             machine_id=tracker2.machine_id,
         )
@@ -188,19 +209,42 @@ def main(argv: list[str] | None = None) -> int:
         tracker1.raise_window()
         plt.pause(0.01)
 
+    # On macOS all windows share one NSApp run loop, so a single
+    # flush_events() per frame drains events for both figures.
+    if sys.platform == "darwin":
+        flush_canvases = (fig1.canvas,)
+    else:
+        flush_canvases = (fig1.canvas, fig2.canvas)
+
+    pause = max(args.pause, 0.0)
     target_fps = float(args.fps)
     dt = 1.0 / target_fps if target_fps > 0 else 0.0
     t0 = time.perf_counter()
 
     for k in range(max(args.frames, 1)):
         phase = 0.15 * k
-        line1.set_ydata([math.sin(v + phase) for v in omega_x])
+        np.add(omega_x, phase, out=phi)
+        np.sin(phi, out=y_phase)
+        line1.set_ydata(y_phase)
 
         # Amplitude oscillates between -1 and 1.
         amp = math.sin(0.05 * k)
-        line2.set_ydata([amp * math.sin(v) for v in omega_x])
-        ax2.set_title(f"amplitude-modulated sine (amp={amp:+.2f})")
-        plt.pause(max(args.pause, 0.0))
+        np.multiply(sin_omega_x, amp, out=y_amp)
+        line2.set_ydata(y_amp)
+
+        # Updating titles is relatively expensive; do it at a lower rate.
+        if k % 10 == 0:
+            ax2.set_title(f"amplitude-modulated sine (amp={amp:+.2f})")
+
+        # Schedule a redraw and drain pending GUI events; pacing (if any) is
+        # handled below instead of by plt.pause()'s internal sleep.
+        if pause > 0.0:
+            plt.pause(pause)
+        else:
+            fig1.canvas.draw_idle()
+            fig2.canvas.draw_idle()
+            for canvas in flush_canvases:
+                canvas.flush_events()
 
         if dt > 0.0:
             next_t = t0 + (k + 1) * dt
@@ -4,9 +4,12 @@ import argparse
 import os
 import sys
 
+import matplotlib
+
 
 def _print_state(label: str) -> None:
-    import matplotlib
+    # pyplot is imported lazily so `--initial` can still select the backend
+    # before the first pyplot import.
     import matplotlib.pyplot as plt
 
     print(f"\n[{label}]", flush=True)
@@ -67,11 +70,8 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.initial is not None:
         # Ensure we can still set the backend before pyplot import.
-        import matplotlib
-
         matplotlib.use(args.initial, force=True)
 
-    import matplotlib
     import matplotlib.pyplot as plt
 
     _print_state("start")
@@ -80,8 +80,6 @@ def main(argv: list[str] | None = None) -> int:
         if args.tick <= 0:
             return
         try:
-            import matplotlib.pyplot as plt
-
             plt.pause(args.tick)
         except Exception as e:
             print(f"tick failed after {label}: {type(e).__name__}: {e}", flush=True)
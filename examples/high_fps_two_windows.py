@@ -2,13 +2,66 @@ from __future__ import annotations
 
 import argparse
 import math
+import sys
 import time
+from typing import Any
+
+import numpy as np
+
+try:  # Optional: compiled trig kernel for large --n.
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this size the NumPy ufuncs win (kernel dispatch overhead dominates).
+_NUMBA_MIN_N = 4096
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _fill_sin_cos(omega_x: Any, phase: float, out_sin: Any, out_cos: Any) -> None:
+        for i in range(omega_x.shape[0]):
+            a = omega_x[i] + phase
+            out_sin[i] = math.sin(a)
+            out_cos[i] = math.cos(a)
+
+else:
+    _fill_sin_cos = None
+
+
+class _LineBlitter:
+    """Redraw a single animated line on top of a cached axes background.
+
+    The background is re-captured on every full draw (`draw_event`), so
+    window resizes and other full redraws keep working. GUI events are not
+    pumped here; the caller flushes once per frame for all windows.
+    """
+
+    def __init__(self, fig: Any, ax: Any, line: Any) -> None:
+        self.canvas = fig.canvas
+        self.ax = ax
+        self.line = line
+        self.background: Any = None
+        line.set_animated(True)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, _event: Any) -> None:
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+
+    def update(self) -> None:
+        if self.background is None:
+            # Triggers `draw_event`, which captures the background.
+            self.canvas.draw()
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
 
 
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(
         description=(
-            "High-FPS Matplotlib-native demo (two windows; line.set_ydata + plt.pause)."
+            "High-FPS Matplotlib-native demo (two windows; line.set_ydata + blitting)."
         )
     )
     p.add_argument("--fps", type=float, default=120.0, help="Target frames per second")
@@ -17,8 +70,11 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument(
         "--pause",
         type=float,
-        default=0.001,
-        help="plt.pause() dt (GUI event pumping)",
+        default=0.0,
+        help=(
+            "If > 0 and blitting is unsupported, pump GUI events with "
+            "plt.pause(PAUSE) instead of draw_idle() + flush_events()"
+        ),
     )
     args = p.parse_args(argv)
 
@@ -27,21 +83,47 @@ def main(argv: list[str] | None = None) -> int:
     from matplotlib_window_tracker import hold_windows, is_interactive
 
     n = max(args.n, 10)
-    x = [i / (n - 1) for i in range(n)]
-    omega = 2.0 * math.pi
+    # One read-only x grid shared by both lines (never rewritten while animating).
+    x = np.linspace(0.0, 1.0, n, dtype=np.float64)
+    x.flags.writeable = False
+    omega_x = (2.0 * np.pi) * x
+    # Preallocated per-frame buffers: phase-shifted angle and the two outputs.
+    phi = np.empty(n)
+    y1 = np.empty(n)
+    y2 = np.empty(n)
+    fill_sin_cos = _fill_sin_cos if n >= _NUMBA_MIN_N else None
 
     fig1, ax1 = plt.subplots(num="high_fps: sin", clear=True, figsize=(8, 4))
-    (line1,) = ax1.plot(x, [0.0 for _ in x])
+    (line1,) = ax1.plot(x, np.zeros(n))
     ax1.set_ylim(-1.2, 1.2)
     ax1.grid(True, alpha=0.3)
     ax1.set_title("sin")
 
     fig2, ax2 = plt.subplots(num="high_fps: cos", clear=True, figsize=(8, 4))
-    (line2,) = ax2.plot(x, [0.0 for _ in x], color="tab:orange")
+    (line2,) = ax2.plot(x, np.zeros(n), color="tab:orange")
     ax2.set_ylim(-1.2, 1.2)
     ax2.grid(True, alpha=0.3)
     ax2.set_title("cos")
 
+    # Realize the windows before caching backgrounds for blitting.
+    plt.show(block=False)
+    plt.pause(0.1)
+
+    blitters: list[_LineBlitter] | None = None
+    if all(getattr(f.canvas, "supports_blit", False) for f in (fig1, fig2)):
+        blitters = [
+            _LineBlitter(fig1, ax1, line1),
+            _LineBlitter(fig2, ax2, line2),
+        ]
+
+    # On macOS all windows share one NSApp run loop, so a single
+    # flush_events() per frame drains events for both figures.
+    if sys.platform == "darwin":
+        flush_canvases = (fig1.canvas,)
+    else:
+        flush_canvases = (fig1.canvas, fig2.canvas)
+
+    pause = max(args.pause, 0.0)
     fps = max(args.fps, 1.0)
     dt = 1.0 / fps
     t0 = time.perf_counter()
@@ -51,11 +133,27 @@ def main(argv: list[str] | None = None) -> int:
     for k in range(max(args.frames, 1)):
         frame_t0 = time.perf_counter()
         phase = 0.15 * k
-        line1.set_ydata([math.sin(omega * xi + phase) for xi in x])
-        line2.set_ydata([math.cos(omega * xi + phase) for xi in x])
-
-        # Event pump.
-        plt.pause(max(args.pause, 0.0))
+        if fill_sin_cos is not None:
+            fill_sin_cos(omega_x, phase, y1, y2)
+        else:
+            np.add(omega_x, phase, out=phi)
+            np.sin(phi, out=y1)
+            np.cos(phi, out=y2)
+        line1.set_ydata(y1)
+        line2.set_ydata(y2)
+
+        # Redraw only the lines, then pump GUI events.
+        if blitters is None and pause > 0.0:
+            plt.pause(pause)
+        else:
+            if blitters is not None:
+                for b in blitters:
+                    b.update()
+            else:
+                fig1.canvas.draw_idle()
+                fig2.canvas.draw_idle()
+            for canvas in flush_canvases:
+                canvas.flush_events()
 
         work_dt = time.perf_counter() - frame_t0
         if not behind and work_dt > dt:
@@ -79,8 +177,6 @@ def main(argv: list[str] | None = None) -> int:
         if next_t > now:
             time.sleep(next_t - now)
 
-    plt.show(block=False)
-
     if not is_interactive():
         hold_windows()
 
@@ -6,8 +6,9 @@ def main() -> None:
 
     Demonstrates:
     - GUI figure show (nonblocking)
-    - switching to a file backend for export
-    - switching back to the GUI backend
+    - file export without switching backends (`savefig` picks the renderer
+      from the file extension)
+    - more GUI figures afterwards, on the same backend
     """
 
     gui_backend = "macosx"
@@ -16,19 +17,21 @@ def main() -> None:
 
     matplotlib.use(gui_backend)
     import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     fig1, ax1 = plt.subplots()
     ax1.plot([1, 2, 3], [1, 4, 9])
     ax1.set_title("Figure 1 (GUI)")
     fig1.show()
 
-    plt.switch_backend("svg")
-    fig2, ax2 = plt.subplots()
+    # Export-only figure: not registered with pyplot, so no window is opened
+    # and the GUI backend never has to be torn down and re-initialized.
+    fig2 = Figure()
+    ax2 = fig2.subplots()
     ax2.plot([1, 2, 3], [9, 4, 1])
     ax2.set_title("Figure 2 (svg)")
     fig2.savefig("output.svg")
 
-    plt.switch_backend(gui_backend)
     fig3, ax3 = plt.subplots()
     ax3.plot([1, 2, 3], [2, 5, 2])
     ax3.set_title("Figure 3 (GUI)")
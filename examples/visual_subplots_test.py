@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import argparse
-import math
 import sys
 import threading
 import time
 from typing import Any
 
+import numpy as np
+
+# Shared x grid for every step (read-only: lines from earlier steps may still
+# reference it when --no-clear is used).
+_X = np.linspace(0.0, 2.0 * np.pi, 400)
+_X.flags.writeable = False
+
 
 def _process_events(fig: Any, dt: float) -> None:
     import matplotlib.pyplot as plt
@@ -54,29 +60,24 @@ def _wait_for_enter_or_close(fig: Any, *, prompt: str) -> None:
 
 
 def _plot_step(ax: Any, *, step: int) -> None:
-    n = 400
-    x = [2.0 * math.pi * i / (n - 1) for i in range(n)]
-    y = [math.sin(v + 0.7 * step) for v in x]
-    ax.plot(x, y, lw=2)
+    # Fresh y per step: with --no-clear the previous step's line stays on the
+    # axes, so its data must not be overwritten in place.
+    y = np.sin(_X + 0.7 * step)
+    ax.plot(_X, y, lw=2)
     ax.set_ylim(-1.2, 1.2)
     ax.grid(True, alpha=0.25)
     ax.set_title(f"visual_subplots_test step={step}")
 
 
-def _mk_fig_ax(*, call: str, num: str | None, clear: bool):
+def _mk_fig_ax(*, num: str | None, clear: bool):
     import matplotlib.pyplot as plt
 
-    if call == "pos":
-        if num is None:
-            return plt.subplots(1, 1, figsize=(7.0, 4.0))
-        return plt.subplots(1, 1, num=num, clear=clear, figsize=(7.0, 4.0))
-
-    if call == "num_kw":
-        if num is None:
-            return plt.subplots(1, 1, figsize=(7.0, 4.0))
-        return plt.subplots(1, 1, num=num, clear=clear, figsize=(7.0, 4.0))
-
-    raise SystemExit(f"unknown --call: {call!r}")
+    # Both --call variants end up passing the identity as `num=`; `--call` is
+    # validated by argparse and only reported.
+    kwargs: dict[str, Any] = {"figsize": (7.0, 4.0)}
+    if num is not None:
+        kwargs.update(num=num, clear=clear)
+    return plt.subplots(1, 1, **kwargs)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -116,7 +117,7 @@ def main(argv: list[str] | None = None) -> int:
     print(f"num/tag: {num!r}")
     print(f"clear: {clear}")
 
-    fig, ax = _mk_fig_ax(call=args.call, num=num, clear=clear)
+    fig, ax = _mk_fig_ax(num=num, clear=clear)
     _plot_step(ax, step=1)
 
     _process_events(fig, 0.001)
@@ -130,7 +131,7 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     # Step 2: call subplots again, expecting reuse if num/tag is set.
-    fig2, ax2 = _mk_fig_ax(call=args.call, num=num, clear=clear)
+    fig2, ax2 = _mk_fig_ax(num=num, clear=clear)
     _plot_step(ax2, step=2)
 
     _process_events(fig2, 0.001)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
 try:
     import matplotlib  # noqa: F401
@@ -14,10 +14,6 @@ from ._helpers import is_interactive
 from .core import hold_windows
 from .geometry_cache import WindowTracker, track_position_size
 
-try:
-    __version__ = version("matplotlib-window-tracker")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.0.0"
 
 __all__ = [
     "__version__",
@@ -28,3 +24,18 @@ __all__ = [
     "track_position_size",
     "WindowTracker",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve `__version__` lazily: the installed-distribution metadata lookup
+    # is comparatively slow and most imports never need it.
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            v = version("matplotlib-window-tracker")
+        except PackageNotFoundError:  # pragma: no cover
+            v = "0.0.0"
+        globals()["__version__"] = v
+        return v
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
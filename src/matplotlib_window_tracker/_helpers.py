@@ -5,6 +5,7 @@ import warnings
 
 __all__ = [
     "_IN_IPYTHON",
+    "_IS_INTERACTIVE",
     "_WARNED_ONCE",
     "is_interactive",
     "_in_ipython",
@@ -16,6 +17,9 @@ _WARNED_ONCE: set[str] = set()
 # - None: not checked yet
 # - True/False: cached result
 _IN_IPYTHON: bool | None = None
+# Cached `is_interactive()` result (same None/True/False convention). None of
+# the probed signals change once the session has started.
+_IS_INTERACTIVE: bool | None = None
 
 
 def _warn_once(
@@ -65,8 +69,21 @@ def is_interactive() -> bool:
 
     The library uses it to choose safe defaults for interactive workflows
     (e.g. to decide whether a script should keep windows open at the end).
+
+    The result is computed once per process and cached.
     """
 
+    global _IS_INTERACTIVE
+    if _IS_INTERACTIVE is not None:
+        return _IS_INTERACTIVE
+
+    _IS_INTERACTIVE = _detect_interactive()
+    return _IS_INTERACTIVE
+
+
+def _detect_interactive() -> bool:
+    """Uncached implementation of `is_interactive()`."""
+
     if _in_ipython():
         return True
 
@@ -4,6 +4,8 @@ import os
 import sys
 from typing import Any
 
+import matplotlib
+
 from ._helpers import _warn_once
 
 __all__ = [
@@ -11,6 +13,10 @@ __all__ = [
     "raise_window",
 ]
 
+# Cached (backend name, backend family) pair used by `raise_window()`. The
+# family is recomputed only when `matplotlib.get_backend()` changes.
+_BACKEND_FAMILY_CACHE: tuple[str, str | None] | None = None
+
 
 def recommended_backend(
     *,
@@ -40,8 +46,6 @@ def recommended_backend(
     ```
     """
 
-    import matplotlib
-
     try:
         current = str(matplotlib.get_backend())
     except Exception as e:
@@ -91,22 +95,41 @@ def raise_window(fig: Any) -> None:
     except Exception:
         pass
 
-    try:
-        import matplotlib
+    raise_fn = _RAISE_BY_FAMILY.get(_backend_family())
+    if raise_fn is not None:
+        raise_fn(fig)
 
-        backend = str(matplotlib.get_backend()).lower()
-    except Exception:
-        backend = ""
 
-    if "macosx" in backend:
-        _raise_macosx(fig)
-        return
-    if "qtagg" in backend or backend.startswith("qt"):
-        _raise_qt(fig)
-        return
-    if "tkagg" in backend or backend.startswith("tk"):
-        _raise_tk(fig)
-        return
+def _backend_family() -> str | None:
+    """Return "macosx", "qt", "tk" or None for the current Matplotlib backend.
+
+    The classification is cached and only recomputed when the backend name
+    reported by `matplotlib.get_backend()` changes.
+    """
+
+    global _BACKEND_FAMILY_CACHE
+
+    try:
+        backend = str(matplotlib.get_backend())
+    except Exception:
+        return None
+
+    cached = _BACKEND_FAMILY_CACHE
+    if cached is not None and cached[0] == backend:
+        return cached[1]
+
+    b = backend.lower()
+    family: str | None
+    if "macosx" in b:
+        family = "macosx"
+    elif "qtagg" in b or b.startswith("qt"):
+        family = "qt"
+    elif "tkagg" in b or b.startswith("tk"):
+        family = "tk"
+    else:
+        family = None
+    _BACKEND_FAMILY_CACHE = (backend, family)
+    return family
 
 
 def _raise_macosx(fig: Any) -> None:
@@ -160,3 +183,10 @@ def _raise_tk(fig: Any) -> None:
             focus()
     except Exception:
         return
+
+
+_RAISE_BY_FAMILY = {
+    "macosx": _raise_macosx,
+    "qt": _raise_qt,
+    "tk": _raise_tk,
+}
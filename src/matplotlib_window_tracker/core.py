@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import contextlib
 import sys
-from typing import Literal
+import time
+from typing import Any, Callable, Literal
 
 from .terminal import _make_anykey_checker, _make_enterkey_checker
 
@@ -13,6 +14,18 @@ __all__ = [
 
 _PROMPT_DEFAULT = object()
 
+# Idle backoff for the `hold_windows()` poll loop: after this many polls with
+# no change in the open figures, the wait per poll grows by one `poll` step.
+_IDLE_BACKOFF_TICKS = 20
+# Upper bound (seconds) for the backed-off wait.
+_IDLE_POLL_MAX = 0.25
+
+# Default prompts printed by `hold_windows()`, keyed by trigger.
+_DEFAULT_PROMPTS = {
+    "AnyKey": "Press any key to exit...",
+    "Enter": "Press Enter to exit...",
+}
+
 
 def hold_windows(
     *,
@@ -34,11 +47,14 @@ def hold_windows(
     Notes:
     - The function is a best-effort convenience. It does not try to select a
       backend or override Matplotlib configuration.
-    - It uses Matplotlib primitives (`plt.pause` / canvas.start_event_loop) to
-      keep windows responsive.
+    - It keeps windows responsive by running the figure canvas' own
+      `start_event_loop` for each poll. If that raises, the poll falls back to
+      `plt.pause` and the canvas is looked up again on the next poll.
 
     Parameters:
-    - poll: seconds to wait between GUI event processing steps.
+    - poll: seconds to wait between GUI event processing steps. While the open
+      figures stay unchanged the wait gradually backs off to at most 0.25 s
+      (or `poll`, if larger) to reduce idle wakeups.
     - prompt: message printed before waiting.
       - If omitted, a default prompt is printed based on `trigger`.
       - If None, nothing is printed.
@@ -47,10 +63,6 @@ def hold_windows(
       This avoids blocking in non-interactive environments (CI, piped input).
     """
 
-    import threading
-
-    import matplotlib.pyplot as plt
-
     if only_if_tty:
         try:
             if not sys.stdin.isatty():
@@ -58,21 +70,24 @@ def hold_windows(
         except Exception:
             return
 
+    # Without pyplot there are no pyplot-managed figures to hold; return before
+    # paying for the import (e.g. headless CI runs).
+    if "matplotlib.pyplot" not in sys.modules:
+        return
+
+    import matplotlib.pyplot as plt
+
     try:
         if not plt.get_fignums():
             return
     except Exception:
         return
 
-    if trigger not in ("Enter", "AnyKey"):
+    if trigger not in _DEFAULT_PROMPTS:
         raise ValueError(f"Unknown trigger: {trigger!r}. Expected 'Enter' or 'AnyKey'.")
 
     if prompt is _PROMPT_DEFAULT:
-        prompt = (
-            "Press any key to exit..."
-            if trigger == "AnyKey"
-            else "Press Enter to exit..."
-        )
+        prompt = _DEFAULT_PROMPTS[trigger]
     if prompt is not None:
         print(str(prompt), flush=True)
 
@@ -83,10 +98,27 @@ def hold_windows(
     else:
         key_ctx, key_pressed, _ = _make_enterkey_checker()
 
+    # Bind the pyplot entry points used by the poll loop once.
+    get_fignums = plt.get_fignums
+    figure = plt.figure
+    pause = plt.pause
+
+    # The canvas whose events we pump is re-resolved only when the set of open
+    # figures changes.
+    last_fignums: tuple[Any, ...] | None = None
+    tick: Callable[[float], None] | None = None
+
+    # Idle backoff: every `_IDLE_BACKOFF_TICKS` polls without a figure change
+    # the wait grows by one `poll`, up to `_IDLE_POLL_MAX` (never below `poll`).
+    idle_ticks = 0
+    max_wait = max(poll, _IDLE_POLL_MAX)
+    wait = poll
+
     with key_ctx:
         while True:
             try:
-                if not plt.get_fignums():
+                fignums = get_fignums()
+                if not fignums:
                     return
             except Exception:
                 return
@@ -96,14 +128,46 @@ def hold_windows(
 
             # Keep processing GUI events without repeatedly calling plt.show().
             try:
-                fignums = plt.get_fignums()
-                fig = plt.figure(fignums[0]) if fignums else None
-                start_loop = getattr(
-                    getattr(fig, "canvas", None), "start_event_loop", None
-                )
-                if callable(start_loop):
-                    start_loop(poll)
+                current = tuple(fignums)
+                if tick is None or current != last_fignums:
+                    tick = None
+                    fig = figure(fignums[0])
+                    tick = _make_gui_tick(getattr(fig, "canvas", None))
+                    last_fignums = current
+                    idle_ticks = 0
+                    wait = poll
                 else:
-                    plt.pause(poll)
+                    idle_ticks += 1
+                    if wait < max_wait and idle_ticks % _IDLE_BACKOFF_TICKS == 0:
+                        wait = min(wait + poll, max_wait)
+                tick(wait)
             except Exception:
-                plt.pause(poll)
+                # Re-resolve the tick on the next poll, and keep pumping GUI
+                # events in the meantime so the windows do not freeze.
+                tick = None
+                pause(wait)
+
+
+def _make_gui_tick(canvas: Any) -> Callable[[float], None]:
+    """Return a callable `tick(dt)` that processes GUI events for about `dt` s.
+
+    This is the canvas' own `start_event_loop(dt)`, which every Matplotlib
+    `FigureCanvasBase` provides; unlike `plt.pause()` it does not redraw or
+    re-show the figure. The `flush_events` plus sleep and plain sleep branches
+    only cover objects that are not Matplotlib canvases (e.g. a missing canvas).
+    """
+
+    start_loop = getattr(canvas, "start_event_loop", None)
+    if callable(start_loop):
+        return start_loop
+
+    flush = getattr(canvas, "flush_events", None)
+    if callable(flush):
+
+        def _flush_and_sleep(dt: float) -> None:
+            flush()
+            time.sleep(dt)
+
+        return _flush_and_sleep
+
+    return time.sleep
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import math
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +15,8 @@ def two_windows_main() -> None:
     """
 
     import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.axes import Axes
 
     # Backend selection is intentionally explicit. In IPython, use:
     #   %matplotlib macosx  (macOS)
@@ -28,16 +29,17 @@ def two_windows_main() -> None:
     stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
     n = 400
-    x = [i / (n - 1) for i in range(n)]
-    y_sin = [math.sin(2.0 * math.pi * xi) for xi in x]
-    y_cos = [math.cos(2.0 * math.pi * xi) for xi in x]
+    x = np.linspace(0.0, 1.0, n)
+    two_pi_x = 2.0 * np.pi * x
+    y_sin = np.sin(two_pi_x)
+    y_cos = np.cos(two_pi_x)
 
-    def _require_axes(ax: Any, *, name: str) -> Any:
+    def _require_axes(ax: Any, *, name: str) -> Axes:
         """Validate the demo got a single Axes, not an array."""
 
         # In this demo we expect a single Axes (nrows=ncols=1). Fail fast if the
         # Matplotlib return shape changes.
-        if hasattr(ax, "plot") and hasattr(ax, "set_title"):
+        if isinstance(ax, Axes):
             return ax
         raise TypeError(
             f"Expected a single Matplotlib Axes for {name}, got {type(ax)!r}"
@@ -71,8 +73,6 @@ def two_windows_main() -> None:
 
     if is_interactive():
         # Nonblocking: let Matplotlib pump events for all open figures.
-        import matplotlib.pyplot as plt
-
         plt.show(block=False)
         return
 
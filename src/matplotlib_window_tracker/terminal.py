@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import sys
 from typing import Any, Callable
 
@@ -11,6 +12,27 @@ __all__ = [
     "_make_enterkey_checker",
 ]
 
+# Upper bound on pending input consumed per key detection (bytes on POSIX,
+# characters on Windows). Pastes and escape sequences are drained in one go
+# so they do not re-trigger on the next poll.
+_ANYKEY_DRAIN_MAX = 4096
+
+# Shared `_warn_once` message for every way the AnyKey trigger can fail.
+_ANYKEY_UNAVAILABLE = (
+    "matplotlib_window_tracker.hold_windows: AnyKey trigger unavailable; falling back to Enter"
+)
+
+# Upper bound on a single polled Enter read. A canonical-mode terminal returns
+# at most one line per read, so this only needs to cover one typed line.
+_ENTER_READ_MAX = 4096
+
+# State of the Enter reader thread (see `_make_enterkey_checker`): the queue it
+# hands its line to, and whether a reader is currently blocked on stdin. A
+# reader still blocked from an earlier wait is reused, so repeated
+# `hold_windows()` calls never leave several threads competing for input.
+_ENTER_LINES: Any = None
+_ENTER_READER_ALIVE = False
+
 
 def _make_enterkey_checker() -> tuple[
     contextlib.AbstractContextManager[None], Callable[[], bool], bool
@@ -26,32 +48,127 @@ def _make_enterkey_checker() -> tuple[
     - supported: False when stdin/threading is unavailable.
 
     Implementation:
-    - Starts a daemon thread blocked on `sys.stdin.readline()`.
-    - The checker returns `threading.Event.is_set`.
+    - POSIX with stdin on a terminal: stdin is polled from the calling thread
+      with a selector. In the terminal's canonical (line-buffered) mode the fd
+      only becomes readable once a full line has been entered, and each read
+      returns one line. The context manager closes the selector.
+    - Otherwise (Windows, or stdin redirected from a pipe/file): a daemon thread
+      reads a single line with `sys.stdin.readline()`, queues it and exits,
+      so later input (e.g. for `input()`) is left alone. A reader still
+      blocked from an earlier call is reused instead of starting another.
+      Lines left over from earlier calls are discarded.
     """
 
-    import threading
+    global _ENTER_LINES, _ENTER_READER_ALIVE
+
+    if not sys.platform.startswith("win"):
+        polled = _make_enterkey_select_checker()
+        if polled is not None:
+            return polled
 
-    entered = threading.Event()
+    import queue
 
-    def _wait_for_enter() -> None:
+    if _ENTER_LINES is None:
+        _ENTER_LINES = queue.SimpleQueue()
+    lines = _ENTER_LINES
+
+    while True:
         try:
-            sys.stdin.readline()
-        except Exception:
-            return
-        entered.set()
+            lines.get_nowait()
+        except queue.Empty:
+            break
+
+    if not _ENTER_READER_ALIVE:
+        _ENTER_READER_ALIVE = True
+        try:
+            _start_daemon_thread(_read_enter_line, lines)
+        except Exception as e:
+            _ENTER_READER_ALIVE = False
+            _warn_once(
+                "hold_windows:enter_thread",
+                "matplotlib_window_tracker.hold_windows: Enter trigger unavailable; ignoring keypress",
+                e,
+            )
+            return contextlib.nullcontext(), lambda: False, False
+
+    def _entered() -> bool:
+        try:
+            lines.get_nowait()
+        except queue.Empty:
+            return False
+        return True
+
+    return contextlib.nullcontext(), _entered, True
+
+
+def _make_enterkey_select_checker() -> tuple[
+    contextlib.AbstractContextManager[Any], Callable[[], bool], bool
+] | None:
+    """POSIX Enter detection without a thread; None unless stdin is a terminal.
+
+    Pipes and files are left to the line reader: a raw read there could take
+    more than one line or count a partial line as Enter.
+    """
 
     try:
-        threading.Thread(target=_wait_for_enter, daemon=True).start()
-    except Exception as e:
-        _warn_once(
-            "hold_windows:enter_thread",
-            "matplotlib_window_tracker.hold_windows: Enter trigger unavailable; ignoring keypress",
-            e,
-        )
-        return contextlib.nullcontext(), lambda: False, False
+        import selectors
+
+        fd = sys.stdin.fileno()
+        if not os.isatty(fd):
+            return None
+        sel = selectors.DefaultSelector()
+    except Exception:
+        return None
+    try:
+        sel.register(fd, selectors.EVENT_READ)
+    except Exception:
+        sel.close()
+        return None
+
+    def _entered() -> bool:
+        try:
+            if sel.select(0):
+                # Consume the completed line; an empty read means EOF,
+                # which also ends the wait.
+                os.read(fd, _ENTER_READ_MAX)
+                return True
+        except Exception:
+            return False
+        return False
+
+    return contextlib.closing(sel), _entered, True
+
+
+def _start_daemon_thread(target: Callable[..., None], *args: Any) -> None:
+    """Run `target(*args)` on a new daemon thread.
+
+    Kept as a separate seam so tests can run the target synchronously.
+    """
+
+    import threading
 
-    return contextlib.nullcontext(), entered.is_set, True
+    threading.Thread(target=target, args=args, daemon=True).start()
+
+
+def _read_enter_line(lines: Any) -> None:
+    """Body of the Enter reader thread: read one line from stdin and exit.
+
+    The line is queued (at EOF the empty string, so a pending Enter wait
+    returns too). Read errors are ignored.
+    """
+
+    global _ENTER_READER_ALIVE
+
+    # Clear the flag before queueing, so a call that drains the queue after
+    # this point starts a fresh reader rather than waiting on this one.
+    try:
+        line: str | None = sys.stdin.readline()
+    except Exception:
+        line = None
+    finally:
+        _ENTER_READER_ALIVE = False
+    if line is not None:
+        lines.put(line)
 
 
 def _make_anykey_checker() -> tuple[
@@ -78,7 +195,7 @@ def _make_anykey_checker() -> tuple[
         except Exception as e:
             _warn_once(
                 "hold_windows:anykey_import",
-                "matplotlib_window_tracker.hold_windows: AnyKey trigger unavailable; falling back to Enter",
+                _ANYKEY_UNAVAILABLE,
                 e,
             )
             return contextlib.nullcontext(), lambda: False, False
@@ -88,7 +205,10 @@ def _make_anykey_checker() -> tuple[
                 kbhit = getattr(msvcrt, "kbhit", None)
                 getwch = getattr(msvcrt, "getwch", None)
                 if callable(kbhit) and callable(getwch) and kbhit():
-                    getwch()
+                    for _ in range(_ANYKEY_DRAIN_MAX):
+                        getwch()
+                        if not kbhit():
+                            break
                     return True
             except Exception:
                 return False
@@ -98,13 +218,13 @@ def _make_anykey_checker() -> tuple[
 
     # POSIX path.
     try:
-        import select
-        import termios
-        import tty
+        import selectors
+        import termios  # noqa: F401
+        import tty  # noqa: F401
     except Exception as e:
         _warn_once(
             "hold_windows:anykey_import",
-            "matplotlib_window_tracker.hold_windows: AnyKey trigger unavailable; falling back to Enter",
+            _ANYKEY_UNAVAILABLE,
             e,
         )
         return contextlib.nullcontext(), lambda: False, False
@@ -114,36 +234,83 @@ def _make_anykey_checker() -> tuple[
     except Exception as e:
         _warn_once(
             "hold_windows:anykey_fileno",
-            "matplotlib_window_tracker.hold_windows: AnyKey trigger unavailable; falling back to Enter",
+            _ANYKEY_UNAVAILABLE,
             e,
         )
         return contextlib.nullcontext(), lambda: False, False
 
-    @contextlib.contextmanager
-    def _cbreak() -> Any:
-        try:
-            old = termios.tcgetattr(fd)
-        except Exception:
-            old = None
-
-        try:
-            tty.setcbreak(fd)
-            yield
-        finally:
-            if old is not None:
-                try:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old)
-                except Exception:
-                    pass
+    # Register stdin once so each poll is a single readiness check on a
+    # persistent interest set (epoll/kqueue where available).
+    try:
+        sel = selectors.DefaultSelector()
+    except Exception as e:
+        _warn_once(
+            "hold_windows:anykey_selector",
+            _ANYKEY_UNAVAILABLE,
+            e,
+        )
+        return contextlib.nullcontext(), lambda: False, False
+    try:
+        sel.register(fd, selectors.EVENT_READ)
+    except Exception as e:
+        sel.close()
+        _warn_once(
+            "hold_windows:anykey_selector",
+            _ANYKEY_UNAVAILABLE,
+            e,
+        )
+        return contextlib.nullcontext(), lambda: False, False
 
     def _pressed() -> bool:
         try:
-            r, _, _ = select.select([sys.stdin], [], [], 0)
-            if r:
-                sys.stdin.read(1)
+            if sel.select(0):
+                # Raw read on the fd: skips the TextIOWrapper decoder and
+                # drains the whole burst (multibyte keys, escape sequences,
+                # pastes) in a single syscall.
+                os.read(fd, _ANYKEY_DRAIN_MAX)
                 return True
         except Exception:
             return False
         return False
 
-    return _cbreak(), _pressed, True
+    return _Cbreak(fd, sel), _pressed, True
+
+
+class _Cbreak:
+    """Put a POSIX terminal fd in cbreak mode while the context is active.
+
+    On exit the saved terminal attributes are restored and `sel` (the stdin
+    selector used by the AnyKey checker) is closed. Failures are ignored.
+    """
+
+    __slots__ = ("fd", "sel", "old")
+
+    def __init__(self, fd: int, sel: Any) -> None:
+        self.fd = fd
+        self.sel = sel
+        self.old: Any = None
+
+    def __enter__(self) -> None:
+        import termios
+        import tty
+
+        try:
+            self.old = termios.tcgetattr(self.fd)
+        except Exception:
+            self.old = None
+        try:
+            tty.setcbreak(self.fd)
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+
+    def __exit__(self, *exc_info: Any) -> None:
+        import termios
+
+        if self.old is not None:
+            try:
+                termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old)
+            except Exception:
+                pass
+            self.old = None
+        self.sel.close()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import types
+from typing import Any, Iterator
+
+import pytest
+
+# Select the headless backend before anything imports matplotlib, so pyplot is
+# initialised once for the whole session instead of being switched per test.
+os.environ["MPLBACKEND"] = "Agg"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _agg_backend() -> Iterator[Any]:
+    # MPLBACKEND already selects Agg at first import; no matplotlib.use() /
+    # pyplot.switch_backend() round-trip is needed.
+    import matplotlib
+
+    assert str(matplotlib.get_backend()).lower() == "agg"
+    yield
+
+
+@pytest.fixture
+def fake_msvcrt(monkeypatch: Any) -> types.ModuleType:
+    """Simulate the Windows console: `sys.platform` and a fake `msvcrt`.
+
+    The fake reports one pending key ("a") forever; tests can override its
+    `kbhit` / `getwch` attributes.
+    """
+
+    monkeypatch.setattr(sys, "platform", "win32")
+    msvcrt = types.ModuleType("msvcrt")
+    msvcrt.kbhit = lambda: True  # type: ignore[attr-defined]
+    msvcrt.getwch = lambda: "a"  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "msvcrt", msvcrt)
+    return msvcrt
+
+
+@pytest.fixture
+def fake_hold_loop(monkeypatch: Any) -> types.SimpleNamespace:
+    """Run `hold_windows()` on fake figures with a scripted Enter trigger.
+
+    stdin looks like a TTY and `plt.figure()` returns a figure whose canvas
+    records each `start_event_loop(dt)`. Tests adjust the returned namespace:
+    - `fignums`: callable returning the open figure numbers (default `[1]`).
+    - `entered`: callable returning True once Enter should count as pressed.
+    - `tick_error`: if set, `start_event_loop` raises it instead of recording.
+    - `ticks` / `resolved`: recorded `dt` values and `plt.figure()` numbers.
+    """
+
+    import matplotlib.pyplot as plt
+
+    from matplotlib_window_tracker import core
+
+    loop = types.SimpleNamespace(
+        fignums=lambda: [1],
+        entered=lambda: False,
+        tick_error=None,
+        ticks=[],
+        resolved=[],
+    )
+
+    class _Canvas:
+        def start_event_loop(self, dt: float) -> None:
+            if loop.tick_error is not None:
+                raise loop.tick_error
+            loop.ticks.append(dt)
+
+    class _Fig:
+        canvas = _Canvas()
+
+    def _figure(num: int) -> _Fig:
+        loop.resolved.append(num)
+        return _Fig()
+
+    monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
+    monkeypatch.setattr(plt, "get_fignums", lambda: loop.fignums())
+    monkeypatch.setattr(plt, "figure", _figure)
+    monkeypatch.setattr(
+        core,
+        "_make_enterkey_checker",
+        lambda: (contextlib.nullcontext(), lambda: loop.entered(), True),
+    )
+    return loop
@@ -16,3 +16,21 @@ def test_in_ipython_respects_builtins___IPYTHON___flag(monkeypatch: Any) -> None
     monkeypatch.delattr(builtins, "__IPYTHON__", raising=False)
     _helpers._IN_IPYTHON = None
     assert _helpers._in_ipython() is False
+
+
+def test_is_interactive_is_cached(monkeypatch: Any) -> None:
+    import sys
+
+    from matplotlib_window_tracker import _helpers
+
+    monkeypatch.setattr(_helpers, "_IS_INTERACTIVE", None)
+    monkeypatch.setattr(_helpers, "_IN_IPYTHON", False)
+    monkeypatch.delattr(sys, "ps1", raising=False)
+    assert _helpers.is_interactive() is False
+
+    # Signals appearing later do not change the cached result.
+    monkeypatch.setattr(sys, "ps1", ">>> ", raising=False)
+    assert _helpers.is_interactive() is False
+
+    monkeypatch.setattr(_helpers, "_IS_INTERACTIVE", None)
+    assert _helpers.is_interactive() is True
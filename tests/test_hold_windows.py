@@ -3,24 +3,16 @@ from __future__ import annotations
 import os
 import sys
 import types
-import threading
 from typing import Any
 
+import matplotlib.pyplot as plt
+import pytest
 
-def _force_agg_backend() -> None:
-    os.environ.setdefault("MPLBACKEND", "Agg")
-    import matplotlib
-
-    matplotlib.use("Agg", force=True)
+from matplotlib_window_tracker import core
+from matplotlib_window_tracker import terminal
 
 
 def test_hold_windows_returns_immediately_when_no_figures(monkeypatch: Any) -> None:
-    _force_agg_backend()
-
-    import matplotlib.pyplot as plt
-
-    from matplotlib_window_tracker import core
-
     monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
     monkeypatch.setattr(plt, "get_fignums", lambda: [])
     called: list[float] = []
@@ -30,44 +22,136 @@ def test_hold_windows_returns_immediately_when_no_figures(monkeypatch: Any) -> N
     assert called == []
 
 
-def test_hold_windows_exits_on_enter(monkeypatch: Any) -> None:
-    _force_agg_backend()
+def test_hold_windows_does_not_import_pyplot(monkeypatch: Any) -> None:
+    monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
+    monkeypatch.delitem(sys.modules, "matplotlib.pyplot", raising=False)
 
-    import matplotlib.pyplot as plt
+    core.hold_windows(poll=0.0, prompt=None)
+    assert "matplotlib.pyplot" not in sys.modules
 
-    from matplotlib_window_tracker import core
-    from matplotlib_window_tracker import terminal
 
+@pytest.mark.parametrize("stdin_strategy", ["reader_thread", "polled_fd"])
+def test_hold_windows_exits_on_enter(monkeypatch: Any, stdin_strategy: str) -> None:
     monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
-    monkeypatch.setattr(terminal.sys.stdin, "readline", lambda: "\n")
 
     # One fake figure exists, so hold_windows() starts waiting.
     monkeypatch.setattr(plt, "get_fignums", lambda: [1])
 
-    # Make the background thread run synchronously.
-    class _ImmediateThread:
-        def __init__(self, *, target: Any, daemon: bool) -> None:
-            self._target = target
-
-        def start(self) -> None:
-            self._target()
-
-    monkeypatch.setattr(threading, "Thread", _ImmediateThread)
-
     called: list[float] = []
     monkeypatch.setattr(plt, "pause", lambda dt: called.append(dt))
 
-    core.hold_windows(poll=0.0, prompt=None, trigger="Enter")
+    if stdin_strategy == "reader_thread":
+        # Use the threaded reader (the Windows path) even on POSIX test runners.
+        monkeypatch.setattr(terminal.sys, "platform", "win32")
+        monkeypatch.setattr(terminal.sys.stdin, "readline", lambda: "\n")
+        monkeypatch.setattr(terminal, "_ENTER_LINES", None)
+        monkeypatch.setattr(terminal, "_ENTER_READER_ALIVE", False)
+
+        # Run the reader synchronously instead of on a thread.
+        monkeypatch.setattr(
+            terminal, "_start_daemon_thread", lambda target, *args: target(*args)
+        )
+        core.hold_windows(poll=0.0, prompt=None, trigger="Enter")
+    else:
+        # POSIX path: a pipe stands in for the terminal, Enter already typed.
+        monkeypatch.setattr(terminal.sys, "platform", "linux")
+        monkeypatch.setattr(terminal.os, "isatty", lambda fd: True)
+        r, w = os.pipe()
+        try:
+            os.write(w, b"\n")
+            monkeypatch.setattr(
+                core.sys,
+                "stdin",
+                types.SimpleNamespace(isatty=lambda: True, fileno=lambda: r),
+            )
+            core.hold_windows(poll=0.0, prompt=None, trigger="Enter")
+        finally:
+            os.close(r)
+            os.close(w)
+
     assert called == []
 
 
-def test_hold_windows_only_if_tty(monkeypatch: Any) -> None:
-    _force_agg_backend()
-
-    import matplotlib.pyplot as plt
+def test_enterkey_checker_reuses_running_reader_thread(monkeypatch: Any) -> None:
+    monkeypatch.setattr(terminal.sys, "platform", "win32")
+    monkeypatch.setattr(terminal, "_ENTER_LINES", None)
+    monkeypatch.setattr(terminal, "_ENTER_READER_ALIVE", False)
+
+    started: list[Any] = []
+    monkeypatch.setattr(
+        terminal, "_start_daemon_thread", lambda target, *args: started.append(args[0])
+    )
+
+    _, _first, supported = terminal._make_enterkey_checker()
+    assert supported
+    started[0].put("stale\n")
+    _, second, _ = terminal._make_enterkey_checker()
+
+    # The reader is still running: no second thread, and the stale line typed
+    # before the second call does not count as Enter.
+    assert len(started) == 1
+    assert not second()
+    started[0].put("\n")
+    assert second()
+    assert not second()
+
+
+@pytest.mark.parametrize("platform", ["win32", "linux"])
+def test_enterkey_reader_leaves_later_lines_on_stdin(
+    monkeypatch: Any, platform: str
+) -> None:
+    import time
+
+    # On POSIX a pipe-backed stdin is not a terminal, so it also gets the
+    # one-line reader rather than the polled fd.
+    monkeypatch.setattr(terminal.sys, "platform", platform)
+    monkeypatch.setattr(terminal, "_ENTER_LINES", None)
+    monkeypatch.setattr(terminal, "_ENTER_READER_ALIVE", False)
+
+    r, w = os.pipe()
+    with os.fdopen(r, "r") as stdin:
+        monkeypatch.setattr(terminal.sys, "stdin", stdin)
+        _, entered, supported = terminal._make_enterkey_checker()
+        assert supported is True
+        os.write(w, b"enter\nfor input()\n")
+        os.close(w)
+
+        deadline = time.monotonic() + 5.0
+        while not entered():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        # The reader took exactly one line; the next one is still on stdin.
+        assert stdin.readline() == "for input()\n"
+
+
+def test_enterkey_checker_polls_stdin_fd_on_posix(monkeypatch: Any) -> None:
+    monkeypatch.setattr(terminal.sys, "platform", "linux")
+    monkeypatch.setattr(terminal.os, "isatty", lambda fd: True)
+    r, w = os.pipe()
+    try:
+        monkeypatch.setattr(
+            terminal.sys, "stdin", types.SimpleNamespace(fileno=lambda: r)
+        )
+
+        def _no_thread(target: Any, *args: Any) -> None:
+            raise AssertionError("the POSIX Enter checker must not start a thread")
+
+        monkeypatch.setattr(terminal, "_start_daemon_thread", _no_thread)
+
+        ctx, entered, supported = terminal._make_enterkey_checker()
+        assert supported is True
+        with ctx:
+            assert entered() is False
+            os.write(w, b"\n")
+            assert entered() is True
+            assert entered() is False
+    finally:
+        os.close(r)
+        os.close(w)
 
-    from matplotlib_window_tracker import core
 
+def test_hold_windows_only_if_tty(monkeypatch: Any) -> None:
     monkeypatch.setattr(core.sys.stdin, "isatty", lambda: False)
     monkeypatch.setattr(plt, "get_fignums", lambda: [1])
 
@@ -75,17 +159,11 @@ def test_hold_windows_only_if_tty(monkeypatch: Any) -> None:
     core.hold_windows(poll=0.0)
 
 
-def test_hold_windows_exits_on_any_key_windows_path(monkeypatch: Any) -> None:
-    _force_agg_backend()
-
-    import matplotlib.pyplot as plt
-
-    from matplotlib_window_tracker import core
-
-    from matplotlib_window_tracker import terminal
-
-    # Use the Windows (msvcrt) code path even on non-Windows test runners.
-    monkeypatch.setattr(terminal.sys, "platform", "win32")
+def test_hold_windows_exits_on_any_key_windows_path(
+    monkeypatch: Any, fake_msvcrt: types.ModuleType
+) -> None:
+    # `fake_msvcrt` selects the Windows (msvcrt) code path even on non-Windows
+    # test runners, with a key already pending.
 
     # One fake figure exists.
     monkeypatch.setattr(plt, "get_fignums", lambda: [1])
@@ -93,15 +171,71 @@ def test_hold_windows_exits_on_any_key_windows_path(monkeypatch: Any) -> None:
     # Make stdin look like a TTY.
     monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
 
-    # Provide a fake msvcrt module.
-    msvcrt = types.ModuleType("msvcrt")
-    msvcrt.kbhit = lambda: True  # type: ignore[attr-defined]
-    msvcrt.getwch = lambda: "a"  # type: ignore[attr-defined]
-    monkeypatch.setitem(sys.modules, "msvcrt", msvcrt)
-
     # Should return immediately without pumping GUI events.
     called: list[float] = []
     monkeypatch.setattr(plt, "pause", lambda dt: called.append(dt))
 
     core.hold_windows(poll=0.0, trigger="AnyKey", prompt=None)
     assert called == []
+
+
+def test_hold_windows_resolves_canvas_only_when_figures_change(
+    fake_hold_loop: types.SimpleNamespace,
+) -> None:
+    # Figure sets seen by successive polls: [1], [1], [1, 2], [1, 2], ...
+    polls: list[int] = []
+
+    def _pressed() -> bool:
+        polls.append(1)
+        return len(polls) > 4
+
+    fake_hold_loop.fignums = lambda: [1] if len(polls) < 2 else [1, 2]
+    fake_hold_loop.entered = _pressed
+
+    core.hold_windows(poll=0.0, prompt=None, trigger="Enter")
+    assert fake_hold_loop.ticks == [0.0, 0.0, 0.0, 0.0]
+    assert fake_hold_loop.resolved == [1, 1]
+
+
+def test_anykey_windows_path_drains_pending_keys(
+    fake_msvcrt: types.ModuleType,
+) -> None:
+    # A burst of pending input, e.g. a paste.
+    pending = list("abc")
+    fake_msvcrt.kbhit = lambda: bool(pending)  # type: ignore[attr-defined]
+    fake_msvcrt.getwch = lambda: pending.pop(0)  # type: ignore[attr-defined]
+
+    _ctx, pressed, supported = terminal._make_anykey_checker()
+    assert supported is True
+    assert pressed() is True
+    assert pending == []
+    assert pressed() is False
+
+
+def test_hold_windows_backs_off_poll_while_idle(
+    fake_hold_loop: types.SimpleNamespace,
+) -> None:
+    waits = fake_hold_loop.ticks
+    # A second figure appears after 45 polls and resets the backoff.
+    fake_hold_loop.fignums = lambda: [1] if len(waits) < 45 else [1, 2]
+    fake_hold_loop.entered = lambda: len(waits) >= 47
+
+    core.hold_windows(poll=0.1, prompt=None, trigger="Enter")
+    assert waits[:20] == [0.1] * 20
+    assert waits[20:40] == [0.2] * 20
+    assert waits[40:45] == [0.25] * 5
+    assert waits[45:] == [0.1, 0.1]
+
+
+def test_hold_windows_falls_back_to_pause_when_tick_fails(
+    monkeypatch: Any, fake_hold_loop: types.SimpleNamespace
+) -> None:
+    paused: list[float] = []
+    monkeypatch.setattr(plt, "pause", lambda dt: paused.append(dt))
+    fake_hold_loop.tick_error = RuntimeError("event loop unavailable")
+    fake_hold_loop.entered = lambda: len(paused) >= 3
+
+    core.hold_windows(poll=0.0, prompt=None, trigger="Enter")
+    # Every failing tick still pumps events and forces a re-resolution.
+    assert paused == [0.0, 0.0, 0.0]
+    assert fake_hold_loop.resolved == [1, 1, 1]
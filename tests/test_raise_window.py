@@ -30,3 +30,89 @@ def test_raise_window_is_best_effort_on_missing_manager(monkeypatch: Any) -> Non
 
     # Should not raise.
     backends.raise_window(Fig())
+
+
+def test_raise_window_backend_fallback_follows_backend_changes(
+    monkeypatch: Any,
+) -> None:
+    import matplotlib
+
+    from matplotlib_window_tracker import backends
+
+    called: list[str] = []
+
+    class Win:
+        def show(self) -> None:
+            called.append("show")
+
+        def raise_(self) -> None:
+            called.append("raise_")
+
+        def activateWindow(self) -> None:
+            called.append("activateWindow")
+
+        def lift(self) -> None:
+            called.append("lift")
+
+        def focus_force(self) -> None:
+            called.append("focus_force")
+
+    class Mgr:
+        window = Win()
+
+    class Canvas:
+        manager = Mgr()
+
+    class Fig:
+        canvas = Canvas()
+
+    monkeypatch.setattr(matplotlib, "get_backend", lambda: "QtAgg")
+    backends.raise_window(Fig())
+    assert called == ["show", "raise_", "activateWindow"]
+
+    # The cached backend family must be invalidated when the backend changes.
+    called.clear()
+    monkeypatch.setattr(matplotlib, "get_backend", lambda: "TkAgg")
+    backends.raise_window(Fig())
+    assert called == ["lift", "focus_force"]
+
+    called.clear()
+    monkeypatch.setattr(matplotlib, "get_backend", lambda: "Agg")
+    backends.raise_window(Fig())
+    assert called == []
+
+
+def test_raise_tk_resolves_current_window_and_stores_nothing_on_figure() -> None:
+    from matplotlib_window_tracker import backends
+
+    called: list[str] = []
+
+    class Win:
+        def __init__(self, name: str) -> None:
+            self._name = name
+
+        def lift(self) -> None:
+            called.append(f"{self._name}.lift")
+
+    class Mgr:
+        def __init__(self, name: str) -> None:
+            self.window = Win(name)
+
+    class Canvas:
+        manager = Mgr("a")
+
+    class Fig:
+        canvas = Canvas()
+
+    fig = Fig()
+    backends._raise_tk(fig)
+    assert called == ["a.lift"]
+    # No state is attached to the user's figure (it would break pickling and
+    # keep the native window alive).
+    assert vars(fig) == {}
+
+    # A replaced manager is picked up on the next call.
+    called.clear()
+    Canvas.manager = Mgr("b")
+    backends._raise_tk(fig)
+    assert called == ["b.lift"]